@@ -13,28 +13,144 @@ Usage: python import-contacts.py <file> [options]
 """
 
 import argparse
+import calendar
 import csv
 import json
 import os
 import re
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 try:
     import vobject  # For vCard parsing (install with: pip install vobject)
 except ImportError:
     vobject = None
+try:
+    import orjson  # Faster JSON export (install with: pip install orjson)
+except ImportError:
+    orjson = None
+try:
+    import phonenumbers  # Region-aware phone parsing (install with: pip install phonenumbers)
+except ImportError:
+    phonenumbers = None
+try:
+    import ijson  # Incremental parsing of large JSON files (install with: pip install ijson)
+except ImportError:
+    ijson = None
+
+# Contact dumps can run to many MB; read and write them in large blocks
+_IO_BUFFER_SIZE = 1 << 20
+_EXPORT_CHUNK_SIZE = 4 << 20
+
+# vCard files at least this large are parsed across worker processes; below it
+# the pool start-up cost outweighs the gain
+_VCARD_PARALLEL_MIN_BYTES = 4 << 20
+_VCARD_CHUNKSIZE = 64
+
+# JSON files at least this large are parsed incrementally with ijson, which is
+# slower than json.load on small files but never holds the whole document
+_JSON_STREAM_MIN_BYTES = 100 << 20
+
+# Phone numbers keep only digits and '+'. ASCII input is filtered with
+# bytes.translate in a single C pass; the regex handles non-ASCII input (e.g. NBSP).
+_PHONE_DELETE_BYTES = bytes(c for c in range(256) if chr(c) not in '0123456789+')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+# Region assumed for numbers written without a country code
+_DEFAULT_PHONE_REGION = 'US'
+
+# Common date layouts matched in one pass; anything else falls back to strptime
+_DATE_RE = re.compile(
+    r'(?P<ymd_y>\d{4})(?P<sep>[-/])(?P<ymd_m>\d{1,2})(?P=sep)(?P<ymd_d>\d{1,2})'
+    r'|(?P<slash_a>\d{1,2})/(?P<slash_b>\d{1,2})/(?P<slash_y>\d{4})'
+    r'|(?P<mdy_mon>[A-Za-z]+)\s+(?P<mdy_d>\d{1,2}),\s+(?P<mdy_y>\d{4})'
+    r'|(?P<dmy_d>\d{1,2})\s+(?P<dmy_mon>[A-Za-z]+)\s+(?P<dmy_y>\d{4})',
+    re.ASCII
+)
+_MONTHS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+
+# Values repeated on nearly every contact, interned so all contacts share one object
+_CAT_FRIEND = sys.intern('Friend')
+_T_MOBILE = sys.intern('mobile')
+_T_WORK = sys.intern('work')
+_T_HOME = sys.intern('home')
+
+# Exact phone type labels emitted by Google, Outlook and vCard exports (lowercased)
+_PHONE_TYPE_MAP = {
+    '': _T_MOBILE,
+    'mobile': _T_MOBILE,
+    '* mobile': _T_MOBILE,
+    'mobile phone': _T_MOBILE,
+    'cell': _T_MOBILE,
+    'cellular': _T_MOBILE,
+    'work': _T_WORK,
+    '* work': _T_WORK,
+    'business': _T_WORK,
+    'business phone': _T_WORK,
+    'office': _T_WORK,
+    'home': _T_HOME,
+    '* home': _T_HOME,
+    'home phone': _T_HOME,
+    'house': _T_HOME,
+}
+
+# Field layout shared by every imported contact; copy it, then fill in the
+# fields that vary (phones and emails must always get fresh lists)
+_CONTACT_TEMPLATE = {
+    'name': '',
+    'phones': None,
+    'emails': None,
+    'birthday': None,
+    'category': _CAT_FRIEND,
+    'lastContact': None,
+    'notes': ''
+}
+
+
+def _dumps_json(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _cell_expr(index: Optional[int], default: str = '') -> str:
+    """Source for reading a CSV cell, or the default literal when the column is absent"""
+    return f'row[{index}]' if index is not None else repr(default)
+
+
+def _date_expr(index: Optional[int]) -> str:
+    """Source for parsing a date cell; a missing column never yields a date"""
+    return f'parse_date(row[{index}])' if index is not None else 'None'
+
+
+def _first_filled_source(var: str, indices: Tuple[int, ...]) -> List[str]:
+    """Source assigning var the stripped value of the first non-empty column"""
+    lines = []
+    for i in indices:
+        lines += [f'{"elif" if lines else "if"} row[{i}]:', f'    {var} = row[{i}].strip()']
+    if not lines:
+        return [f"{var} = ''"]
+    return lines + ['else:', f"    {var} = ''"]
 
 
 class ContactImporter:
     """Main contact importer class"""
     
     SUPPORTED_FORMATS = {'.csv', '.vcf', '.json'}
+    CSV_FORMATS = ('google_csv', 'outlook_csv', 'android_csv', 'generic_csv')
     
-    def __init__(self, output_dir: str = './imports'):
+    def __init__(self, output_dir: str = './imports', use_phonenumbers: bool = False):
+        if use_phonenumbers and not phonenumbers:
+            raise ImportError("phonenumbers library not installed. Install with: pip install phonenumbers")
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Opt-in: phonenumbers is far slower per call than the digit-strip rules
+        self.use_phonenumbers = use_phonenumbers
         
     def detect_format(self, file_path: Path) -> str:
         """Detect the format of the input file"""
@@ -52,243 +168,442 @@ class ContactImporter:
     
     def _detect_csv_format(self, file_path: Path) -> str:
         """Detect specific CSV format (Google, Outlook, etc.)"""
+        return self._sniff_csv(file_path)[0]
+    
+    def _sniff_csv(self, file_path: Path) -> Tuple[str, str]:
+        """Read the CSV header once to detect its format and delimiter"""
+        # Only the header line is needed, so the default buffer is enough here
         with open(file_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline().strip().lower()
-            
+            header_line = f.readline()
+        
+        first_line = header_line.strip().lower()
+        
         if 'given name' in first_line and 'family name' in first_line:
-            return 'google_csv'
+            csv_type = 'google_csv'
         elif 'first name' in first_line and 'last name' in first_line:
-            return 'outlook_csv'
+            csv_type = 'outlook_csv'
         elif 'display name' in first_line and 'phone' in first_line:
-            return 'android_csv'
+            csv_type = 'android_csv'
         else:
-            return 'generic_csv'
+            csv_type = 'generic_csv'
+        
+        # Only the header is counted: data rows may hold quoted commas or semicolons
+        delimiter = ',' if header_line.count(',') >= header_line.count(';') else ';'
+        return csv_type, delimiter
     
-    def import_file(self, file_path: Path, format_hint: Optional[str] = None) -> List[Dict]:
-        """Import contacts from file"""
+    def _resolve_format(self, file_path: Path, format_hint: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Work out the import format, plus the CSV delimiter when it was sniffed"""
+        delimiter = None
         if format_hint:
             format_type = format_hint
+        elif file_path.suffix.lower() == '.csv':
+            # Format and delimiter come from the same read of the file header
+            format_type, delimiter = self._sniff_csv(file_path)
         else:
             format_type = self.detect_format(file_path)
         
         print(f"Detected format: {format_type}")
+        return format_type, delimiter
+    
+    def import_file(self, file_path: Path, format_hint: Optional[str] = None) -> List[Dict]:
+        """Import contacts from file"""
+        format_type, delimiter = self._resolve_format(file_path, format_hint)
         
         if format_type == 'vcard':
             return self._import_vcard(file_path)
         elif format_type == 'json':
             return self._import_json(file_path)
-        elif format_type in ['google_csv', 'outlook_csv', 'android_csv', 'generic_csv']:
-            return self._import_csv(file_path, format_type)
+        elif format_type in self.CSV_FORMATS:
+            return self._import_csv(file_path, format_type, delimiter)
         else:
             raise ValueError(f"Unknown format: {format_type}")
     
+    def iter_file(self, file_path: Path, format_hint: Optional[str] = None) -> Iterator[Dict]:
+        """Yield contacts from file, streaming CSV and JSON instead of collecting them"""
+        format_type, delimiter = self._resolve_format(file_path, format_hint)
+        
+        if format_type == 'vcard':
+            return iter(self._import_vcard(file_path))
+        elif format_type == 'json':
+            return self._counted(self._iter_json(file_path), 'JSON')
+        elif format_type in self.CSV_FORMATS:
+            return self._counted(self._iter_csv(file_path, format_type, delimiter), format_type)
+        else:
+            raise ValueError(f"Unknown format: {format_type}")
+    
+    @staticmethod
+    def _counted(contacts: Iterable[Dict], source: str) -> Iterator[Dict]:
+        """Pass contacts through, then report how many were imported from source"""
+        count = 0
+        for contact in contacts:
+            count += 1
+            yield contact
+        
+        print(f"Imported {count} contacts from {source}")
+    
     def _import_vcard(self, file_path: Path) -> List[Dict]:
         """Import from vCard (.vcf) file"""
         if not vobject:
             raise ImportError("vobject library not installed. Install with: pip install vobject")
         
         contacts = []
+        workers = os.cpu_count() or 1
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            vcards = vobject.readComponents(f.read())
-        
-        for vcard in vcards:
-            contact = {
-                'name': '',
-                'phones': [],
-                'emails': [],
-                'birthday': None,
-                'category': 'Friend',
-                'lastContact': None,
-                'notes': ''
-            }
-            
-            # Name
-            if hasattr(vcard, 'fn'):
-                contact['name'] = vcard.fn.value
-            elif hasattr(vcard, 'n'):
-                n = vcard.n.value
-                contact['name'] = f"{n.given} {n.family}".strip()
-            
-            # Phone numbers
-            for tel in vcard.contents.get('tel', []):
-                phone_type = 'mobile'
-                if hasattr(tel, 'type_param'):
-                    types = tel.type_param
-                    if 'WORK' in types:
-                        phone_type = 'work'
-                    elif 'HOME' in types:
-                        phone_type = 'home'
-                
-                contact['phones'].append({
-                    'type': phone_type,
-                    'number': self._normalize_phone(tel.value),
-                    'primary': len(contact['phones']) == 0
-                })
-            
-            # Email addresses
-            for email in vcard.contents.get('email', []):
-                contact['emails'].append(email.value)
-            
-            # Birthday
-            if hasattr(vcard, 'bday'):
-                contact['birthday'] = self._parse_date(vcard.bday.value)
-            
-            # Notes
-            if hasattr(vcard, 'note'):
-                contact['notes'] = vcard.note.value
-            
-            if contact['name']:
-                contacts.append(contact)
+        with open(file_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+            if workers > 1 and file_path.stat().st_size >= _VCARD_PARALLEL_MIN_BYTES:
+                # Cards are independent, so split on BEGIN/END and parse them in parallel.
+                # Blocks are submitted in bounded batches: pool.map would otherwise
+                # drain the generator and queue every card up front.
+                blocks = self._iter_vcard_blocks(f)
+                batch_size = workers * _VCARD_CHUNKSIZE
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    while True:
+                        batch = list(islice(blocks, batch_size))
+                        if not batch:
+                            break
+                        for contact in pool.map(self._parse_vcard_block, batch, chunksize=_VCARD_CHUNKSIZE):
+                            if contact:
+                                contacts.append(contact)
+            else:
+                # Parse card by card; vobject.readComponents would read the whole file
+                # into one string first (its non-QP path calls fp.read(-1))
+                for block in self._iter_vcard_blocks(f):
+                    contact = self._parse_vcard_block(block)
+                    if contact:
+                        contacts.append(contact)
         
         print(f"Imported {len(contacts)} contacts from vCard")
         return contacts
     
-    def _import_csv(self, file_path: Path, csv_type: str) -> List[Dict]:
-        """Import from CSV file"""
-        contacts = []
+    @staticmethod
+    def _iter_vcard_blocks(lines: Iterable[str]) -> Iterator[str]:
+        """Split vCard text into one string per top-level BEGIN:VCARD/END:VCARD block
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # Try to detect delimiter
-            sample = f.read(1024)
-            f.seek(0)
-            delimiter = ',' if sample.count(',') > sample.count(';') else ';'
-            
-            reader = csv.DictReader(f, delimiter=delimiter)
+        Non-blank text outside a card and a card left open at end of file are
+        yielded as blocks too, so vobject rejects them as it would the whole file.
+        """
+        block = []
+        depth = 0
+        for line in lines:
+            tag = line.strip().upper()
+            if tag == 'BEGIN:VCARD':
+                if not depth:
+                    if any(text.strip() for text in block):
+                        yield ''.join(block)
+                    block = []
+                depth += 1
+            block.append(line)
+            if tag == 'END:VCARD' and depth:
+                depth -= 1
+                if not depth:
+                    yield ''.join(block)
+                    block = []
+        
+        if any(text.strip() for text in block):
+            yield ''.join(block)
+    
+    def _parse_vcard_block(self, block: str) -> Optional[Dict]:
+        """Parse a single BEGIN:VCARD/END:VCARD block into a contact"""
+        # readComponents rather than readOne: it raises ParseError for stray lines
+        # and unclosed cards, matching a whole-file parse
+        for vcard in vobject.readComponents(block):
+            contact = self._vcard_to_contact(vcard)
+            if contact:
+                return contact
+        return None
+    
+    def _vcard_to_contact(self, vcard) -> Optional[Dict]:
+        """Convert a parsed vCard to a contact, or None if it has no name"""
+        contact = _CONTACT_TEMPLATE.copy()
+        contact['phones'] = []
+        contact['emails'] = []
+        
+        # Properties are looked up in the contents dict (lists of lines) rather
+        # than via hasattr, which goes through vobject's AttributeError path
+        contents = vcard.contents
+        fn = contents.get('fn')
+        n = contents.get('n')
+        bday = contents.get('bday')
+        note = contents.get('note')
+        
+        # Name
+        if fn:
+            contact['name'] = fn[0].value
+        elif n:
+            n = n[0].value
+            contact['name'] = f"{n.given} {n.family}".strip()
+        
+        # Phone numbers
+        first = True
+        for tel in contents.get('tel', []):
+            phone_type = _T_MOBILE
+            type_params = tel.params.get('TYPE')
+            if type_params:
+                types = type_params[0]
+                if 'WORK' in types:
+                    phone_type = _T_WORK
+                elif 'HOME' in types:
+                    phone_type = _T_HOME
             
-            for row in reader:
-                if csv_type == 'google_csv':
-                    contact = self._parse_google_csv_row(row)
-                elif csv_type == 'outlook_csv':
-                    contact = self._parse_outlook_csv_row(row)
-                elif csv_type == 'android_csv':
-                    contact = self._parse_android_csv_row(row)
-                else:  # generic_csv
-                    contact = self._parse_generic_csv_row(row)
-                
-                if contact and contact.get('name'):
-                    contacts.append(contact)
+            contact['phones'].append({
+                'type': phone_type,
+                'number': self._normalize_phone(tel.value),
+                'primary': first
+            })
+            first = False
         
-        print(f"Imported {len(contacts)} contacts from {csv_type}")
-        return contacts
+        # Email addresses
+        for email in contents.get('email', []):
+            contact['emails'].append(email.value)
+        
+        # Birthday
+        if bday:
+            contact['birthday'] = self._parse_date(bday[0].value)
+        
+        # Notes
+        if note:
+            contact['notes'] = note[0].value
+        
+        return contact if contact['name'] else None
     
-    def _parse_google_csv_row(self, row: Dict) -> Dict:
-        """Parse Google Contacts CSV row"""
-        name = f"{row.get('Given Name', '')} {row.get('Family Name', '')}".strip()
-        if not name:
-            name = row.get('Name', '')
+    def _import_csv(self, file_path: Path, csv_type: str, delimiter: Optional[str] = None) -> List[Dict]:
+        """Import from CSV file"""
+        return list(self._counted(self._iter_csv(file_path, csv_type, delimiter), csv_type))
+    
+    def _iter_csv(self, file_path: Path, csv_type: str, delimiter: Optional[str] = None) -> Iterator[Dict]:
+        """Yield contacts from a CSV file one row at a time"""
+        if delimiter is None:
+            delimiter = self._sniff_csv(file_path)[1]
         
-        phones = []
-        for i in range(1, 6):  # Google exports up to 5 phone numbers
-            phone_key = f'Phone {i} - Value' if i > 1 else 'Phone 1 - Value'
-            phone_type_key = f'Phone {i} - Type' if i > 1 else 'Phone 1 - Type'
+        with open(file_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, [])
+            col = {name: i for i, name in enumerate(header)}
             
-            phone = row.get(phone_key, '').strip()
-            if phone:
-                phones.append({
-                    'type': self._normalize_phone_type(row.get(phone_type_key, 'Mobile')),
-                    'number': self._normalize_phone(phone),
-                    'primary': len(phones) == 0
-                })
-        
-        emails = []
-        for i in range(1, 4):  # Google exports up to 3 emails
-            email_key = f'E-mail {i} - Value' if i > 1 else 'E-mail 1 - Value'
-            email = row.get(email_key, '').strip()
-            if email:
-                emails.append(email)
-        
-        return {
-            'name': name,
-            'phones': phones,
-            'emails': emails,
-            'birthday': self._parse_date(row.get('Birthday', '')),
-            'category': 'Friend',
-            'lastContact': None,
-            'notes': row.get('Notes', '')
-        }
+            # Build a parser specialized to this header, then drive the row loop
+            # from C; only contacts with a name are kept
+            parse_row = self._compile_csv_row_parser(csv_type, col, len(header))
+            yield from filter(itemgetter('name'), map(parse_row, reader))
     
-    def _parse_outlook_csv_row(self, row: Dict) -> Dict:
-        """Parse Outlook/Exchange CSV row"""
-        name = f"{row.get('First Name', '')} {row.get('Last Name', '')}".strip()
-        if not name:
-            name = row.get('Display Name', '')
-        
-        phones = []
-        phone_fields = ['Mobile Phone', 'Home Phone', 'Business Phone']
-        for field in phone_fields:
-            phone = row.get(field, '').strip()
-            if phone:
-                phones.append({
-                    'type': self._normalize_phone_type(field),
-                    'number': self._normalize_phone(phone),
-                    'primary': len(phones) == 0
-                })
-        
-        return {
-            'name': name,
-            'phones': phones,
-            'emails': [row.get('E-mail Address', '').strip()] if row.get('E-mail Address') else [],
-            'birthday': self._parse_date(row.get('Birthday', '')),
-            'category': 'Friend',
-            'lastContact': None,
-            'notes': row.get('Notes', '')
+    def _compile_csv_row_parser(self, csv_type: str, col: Dict[str, int], width: int) -> Callable[[List[str]], Dict]:
+        """Generate a row parser with this file's column positions baked in"""
+        if csv_type == 'google_csv':
+            body = self._google_csv_source(self._google_csv_columns(col))
+        elif csv_type == 'outlook_csv':
+            body = self._outlook_csv_source(self._outlook_csv_columns(col))
+        elif csv_type == 'android_csv':
+            body = self._android_csv_source(self._android_csv_columns(col))
+        else:  # generic_csv
+            body = self._generic_csv_source(self._generic_csv_columns(col))
+        
+        # Only integer indices and repr()'d constants reach the source, never header text.
+        # Short rows are padded once so every column access is a plain row[i].
+        source = '\n'.join([
+            'def parse_row(row):',
+            f'    if len(row) < {width}:',
+            f"        row = row + [''] * ({width} - len(row))",
+            *('    ' + line for line in body),
+            '    return contact',
+        ])
+        namespace = {
+            'new_contact': _CONTACT_TEMPLATE.copy,
+            'normalize_phone': self._normalize_phone,
+            'normalize_phone_type': self._normalize_phone_type,
+            'parse_date': self._parse_date,
+            'MOBILE': _T_MOBILE,
         }
+        exec(compile(source, f'<{csv_type} row parser>', 'exec'), namespace)
+        return namespace['parse_row']
     
-    def _parse_android_csv_row(self, row: Dict) -> Dict:
-        """Parse Android Contacts CSV row"""
-        return {
-            'name': row.get('Display Name', '').strip(),
-            'phones': [{'type': 'mobile', 'number': self._normalize_phone(row.get('Phone', '')), 'primary': True}] if row.get('Phone') else [],
-            'emails': [row.get('Email', '').strip()] if row.get('Email') else [],
-            'birthday': None,
-            'category': 'Friend',
-            'lastContact': None,
-            'notes': ''
-        }
+    @staticmethod
+    def _google_csv_columns(col: Dict[str, int]) -> tuple:
+        """Resolve Google Contacts CSV column indices"""
+        return (
+            col.get('Given Name'),
+            col.get('Family Name'),
+            col.get('Name'),
+            # Google exports up to 5 phone numbers
+            tuple((col.get(f'Phone {i} - Value'), col.get(f'Phone {i} - Type')) for i in range(1, 6)),
+            # Google exports up to 3 emails
+            tuple(col.get(f'E-mail {i} - Value') for i in range(1, 4)),
+            col.get('Birthday'),
+            col.get('Notes'),
+        )
     
-    def _parse_generic_csv_row(self, row: Dict) -> Dict:
-        """Parse generic CSV row with field detection"""
-        # Try to find name fields
-        name = ''
-        for field in ['Name', 'Full Name', 'Display Name', 'Contact Name']:
-            if row.get(field):
-                name = row[field].strip()
-                break
-        
-        if not name:
-            # Try first/last name combination
-            first = row.get('First Name', row.get('Given Name', '')).strip()
-            last = row.get('Last Name', row.get('Family Name', '')).strip()
-            name = f"{first} {last}".strip()
-        
-        # Find phone field
-        phone = ''
-        for field in ['Phone', 'Mobile', 'Phone Number', 'Mobile Phone']:
-            if row.get(field):
-                phone = row[field].strip()
-                break
-        
-        # Find email field
-        email = ''
-        for field in ['Email', 'E-mail', 'Email Address']:
-            if row.get(field):
-                email = row[field].strip()
-                break
-        
-        return {
-            'name': name,
-            'phones': [{'type': 'mobile', 'number': self._normalize_phone(phone), 'primary': True}] if phone else [],
-            'emails': [email] if email else [],
-            'birthday': None,
-            'category': 'Friend',
-            'lastContact': None,
-            'notes': row.get('Notes', row.get('Note', ''))
-        }
+    @staticmethod
+    def _outlook_csv_columns(col: Dict[str, int]) -> tuple:
+        """Resolve Outlook/Exchange CSV column indices"""
+        return (
+            col.get('First Name'),
+            col.get('Last Name'),
+            col.get('Display Name'),
+            tuple((col.get(field), field) for field in ('Mobile Phone', 'Home Phone', 'Business Phone')),
+            col.get('E-mail Address'),
+            col.get('Birthday'),
+            col.get('Notes'),
+        )
+    
+    @staticmethod
+    def _android_csv_columns(col: Dict[str, int]) -> tuple:
+        """Resolve Android Contacts CSV column indices"""
+        return (
+            col.get('Display Name'),
+            col.get('Phone'),
+            col.get('Email'),
+        )
+    
+    @staticmethod
+    def _generic_csv_columns(col: Dict[str, int]) -> tuple:
+        """Resolve generic CSV column indices by trying common header names"""
+        return (
+            tuple(col[field] for field in ('Name', 'Full Name', 'Display Name', 'Contact Name') if field in col),
+            col.get('First Name', col.get('Given Name')),
+            col.get('Last Name', col.get('Family Name')),
+            tuple(col[field] for field in ('Phone', 'Mobile', 'Phone Number', 'Mobile Phone') if field in col),
+            tuple(col[field] for field in ('Email', 'E-mail', 'Email Address') if field in col),
+            col.get('Notes', col.get('Note')),
+        )
+    
+    def _google_csv_source(self, idx: tuple) -> List[str]:
+        """Emit parser source for a Google Contacts CSV row"""
+        given_i, family_i, name_i, phone_cols, email_cols, birthday_i, notes_i = idx
+        
+        lines = [
+            f"name = ({_cell_expr(given_i)} + ' ' + {_cell_expr(family_i)}).strip()",
+            'if not name:',
+            f'    name = {_cell_expr(name_i)}',
+            'phones = []',
+            'first = True',
+        ]
+        for value_i, type_i in phone_cols:
+            if value_i is None:
+                continue
+            lines += [
+                f'phone = row[{value_i}].strip()',
+                'if phone:',
+                f"    phones.append({{'type': normalize_phone_type({_cell_expr(type_i, 'Mobile')}), "
+                f"'number': normalize_phone(phone), 'primary': first}})",
+                '    first = False',
+            ]
+        
+        lines.append('emails = []')
+        for email_i in email_cols:
+            if email_i is None:
+                continue
+            lines += [
+                f'email = row[{email_i}].strip()',
+                'if email:',
+                '    emails.append(email)',
+            ]
+        
+        return lines + [
+            'contact = new_contact()',
+            "contact['name'] = name",
+            "contact['phones'] = phones",
+            "contact['emails'] = emails",
+            f"contact['birthday'] = {_date_expr(birthday_i)}",
+            f"contact['notes'] = {_cell_expr(notes_i)}",
+        ]
+    
+    def _outlook_csv_source(self, idx: tuple) -> List[str]:
+        """Emit parser source for an Outlook/Exchange CSV row"""
+        first_i, last_i, display_i, phone_cols, email_i, birthday_i, notes_i = idx
+        
+        lines = [
+            f"name = ({_cell_expr(first_i)} + ' ' + {_cell_expr(last_i)}).strip()",
+            'if not name:',
+            f'    name = {_cell_expr(display_i)}',
+            'phones = []',
+            'first = True',
+        ]
+        for phone_i, field in phone_cols:
+            if phone_i is None:
+                continue
+            # The phone type comes from the column name, so resolve it now
+            lines += [
+                f'phone = row[{phone_i}].strip()',
+                'if phone:',
+                f"    phones.append({{'type': {self._normalize_phone_type(field)!r}, "
+                f"'number': normalize_phone(phone), 'primary': first}})",
+                '    first = False',
+            ]
+        
+        return lines + [
+            f'email = {_cell_expr(email_i)}',
+            'contact = new_contact()',
+            "contact['name'] = name",
+            "contact['phones'] = phones",
+            "contact['emails'] = [email.strip()] if email else []",
+            f"contact['birthday'] = {_date_expr(birthday_i)}",
+            f"contact['notes'] = {_cell_expr(notes_i)}",
+        ]
+    
+    def _android_csv_source(self, idx: tuple) -> List[str]:
+        """Emit parser source for an Android Contacts CSV row"""
+        name_i, phone_i, email_i = idx
+        
+        return [
+            f'phone = {_cell_expr(phone_i)}',
+            f'email = {_cell_expr(email_i)}',
+            'contact = new_contact()',
+            f"contact['name'] = {_cell_expr(name_i)}.strip()",
+            "contact['phones'] = [{'type': MOBILE, 'number': normalize_phone(phone), 'primary': True}] if phone else []",
+            "contact['emails'] = [email.strip()] if email else []",
+        ]
+    
+    def _generic_csv_source(self, idx: tuple) -> List[str]:
+        """Emit parser source for a generic CSV row with field detection"""
+        name_cols, first_i, last_i, phone_cols, email_cols, notes_i = idx
+        
+        lines = (
+            # Try to find name fields
+            _first_filled_source('name', name_cols) + [
+                'if not name:',
+                # Try first/last name combination
+                f"    name = ({_cell_expr(first_i)}.strip() + ' ' + {_cell_expr(last_i)}.strip()).strip()",
+            ] +
+            # Find phone and email fields
+            _first_filled_source('phone', phone_cols) +
+            _first_filled_source('email', email_cols)
+        )
+        
+        return lines + [
+            'contact = new_contact()',
+            "contact['name'] = name",
+            "contact['phones'] = [{'type': MOBILE, 'number': normalize_phone(phone), 'primary': True}] if phone else []",
+            "contact['emails'] = [email] if email else []",
+            f"contact['notes'] = {_cell_expr(notes_i)}",
+        ]
     
     def _import_json(self, file_path: Path) -> List[Dict]:
         """Import from JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
+        return list(self._counted(self._iter_json(file_path), 'JSON'))
+    
+    def _iter_json(self, file_path: Path) -> Iterator[Dict]:
+        """Yield contacts from a JSON list or a {'contacts': [...]} document"""
+        if ijson and file_path.stat().st_size >= _JSON_STREAM_MIN_BYTES:
+            with open(file_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                events = ijson.parse(f, use_float=True)
+                # The first event tells a bare list from the {'contacts': [...]} form
+                _, event, _ = next(events)
+                if event == 'start_array':
+                    prefix = 'item'
+                elif event == 'start_map':
+                    for key_prefix, event, value in events:
+                        if key_prefix == '' and event == 'map_key' and value == 'contacts':
+                            break
+                    else:
+                        raise ValueError("Invalid JSON format")
+                    if next(events, (None, None, None))[1] != 'start_array':
+                        raise ValueError("Invalid JSON format")
+                    prefix = 'contacts.item'
+                else:
+                    raise ValueError("Invalid JSON format")
+                
+                yield from ijson.items(events, prefix)
+            return
+        
+        with open(file_path, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as f:
             data = json.load(f)
         
         if isinstance(data, dict) and 'contacts' in data:
@@ -298,16 +613,27 @@ class ContactImporter:
         else:
             raise ValueError("Invalid JSON format")
         
-        print(f"Imported {len(contacts)} contacts from JSON")
-        return contacts
+        yield from contacts
     
     def _normalize_phone(self, phone: str) -> str:
         """Normalize phone number"""
         if not phone:
             return ''
         
+        if self.use_phonenumbers:
+            try:
+                number = phonenumbers.parse(phone, _DEFAULT_PHONE_REGION)
+            except phonenumbers.NumberParseException:
+                number = None
+            # E.164 has no room for an extension, so those keep the digit-strip form
+            if number is not None and not number.extension and phonenumbers.is_valid_number(number):
+                return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.E164)
+        
         # Remove all non-digit characters except +
-        normalized = re.sub(r'[^\d+]', '', phone)
+        if phone.isascii():
+            normalized = phone.encode('ascii').translate(None, _PHONE_DELETE_BYTES).decode('ascii')
+        else:
+            normalized = _PHONE_STRIP_RE.sub('', phone)
         
         # Ensure it starts with country code
         if normalized and not normalized.startswith('+'):
@@ -321,20 +647,32 @@ class ContactImporter:
     def _normalize_phone_type(self, phone_type: str) -> str:
         """Normalize phone type"""
         phone_type = phone_type.lower()
+        mapped = _PHONE_TYPE_MAP.get(phone_type)
+        if mapped:
+            return mapped
+        
+        # Uncommon labels: fall back to keyword matching
         if 'mobile' in phone_type or 'cell' in phone_type:
-            return 'mobile'
+            return _T_MOBILE
         elif 'work' in phone_type or 'business' in phone_type:
-            return 'work'
+            return _T_WORK
         elif 'home' in phone_type:
-            return 'home'
+            return _T_HOME
         else:
-            return 'mobile'
+            return _T_MOBILE
     
     def _parse_date(self, date_str: str) -> Optional[str]:
         """Parse various date formats"""
         if not date_str:
             return None
         
+        date_str = date_str.strip()
+        match = _DATE_RE.fullmatch(date_str)
+        if match:
+            parsed = self._date_from_match(match)
+            if parsed:
+                return parsed
+        
         # Try various date formats
         date_formats = [
             '%Y-%m-%d',
@@ -348,25 +686,72 @@ class ContactImporter:
         
         for fmt in date_formats:
             try:
-                dt = datetime.strptime(date_str.strip(), fmt)
+                dt = datetime.strptime(date_str, fmt)
                 return dt.strftime('%Y-%m-%d')
             except ValueError:
                 continue
         
         return None
     
-    def export_kinect_json(self, contacts: List[Dict], output_path: Path):
+    @staticmethod
+    def _date_from_match(match: re.Match) -> Optional[str]:
+        """Build an ISO date from a _DATE_RE match, or None if it is not a real date"""
+        groups = match.groupdict()
+        if groups['ymd_y']:
+            candidates = [(groups['ymd_y'], groups['ymd_m'], groups['ymd_d'])]
+        elif groups['slash_y']:
+            # Month-first wins, day-first is the fallback (same order as strptime formats)
+            candidates = [
+                (groups['slash_y'], groups['slash_a'], groups['slash_b']),
+                (groups['slash_y'], groups['slash_b'], groups['slash_a']),
+            ]
+        elif groups['mdy_y']:
+            candidates = [(groups['mdy_y'], _MONTHS.get(groups['mdy_mon'].lower(), 0), groups['mdy_d'])]
+        else:
+            candidates = [(groups['dmy_y'], _MONTHS.get(groups['dmy_mon'].lower(), 0), groups['dmy_d'])]
+        
+        for year, month, day in candidates:
+            year, month, day = int(year), int(month), int(day)
+            if 1 <= year and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+                return date(year, month, day).isoformat()
+        
+        return None
+    
+    def export_kinect_json(self, contacts: Iterable[Dict], output_path: Path) -> int:
         """Export contacts in Kinect-compatible JSON format"""
-        kinect_data = {
+        # Write the envelope by hand so contacts can be serialized one at a time
+        # from any iterable, without holding the whole document in memory
+        envelope = _dumps_json({
             'version': '1.0',
-            'imported_at': datetime.now().isoformat(),
-            'contacts': contacts
-        }
+            'imported_at': datetime.now().isoformat()
+        })
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(kinect_data, f, indent=2, ensure_ascii=False)
+        count = 0
+        # Collect output in memory and hand it to the file in large chunks; a
+        # typical export ends up as a single write
+        buf = bytearray(envelope[:-1] + b',"contacts":[')
+        # Opened outside the try so a failed open never deletes a file that was already there
+        f = open(output_path, 'wb', buffering=_IO_BUFFER_SIZE)
+        try:
+            with f:
+                for contact in contacts:
+                    if count:
+                        buf += b','
+                    buf += _dumps_json(contact)
+                    count += 1
+                    if len(buf) >= _EXPORT_CHUNK_SIZE:
+                        f.write(buf)
+                        buf.clear()
+                buf += b']}'
+                f.write(buf)
+        except BaseException:
+            # Contacts are produced lazily, so a parse error can surface mid-write;
+            # don't leave a truncated export behind
+            output_path.unlink(missing_ok=True)
+            raise
         
-        print(f"Exported {len(contacts)} contacts to {output_path}")
+        print(f"Exported {count} contacts to {output_path}")
+        return count
 
 
 def main():
@@ -376,6 +761,8 @@ def main():
                        help='Force specific format detection')
     parser.add_argument('--output-dir', default='./imports', help='Output directory')
     parser.add_argument('--dry-run', action='store_true', help='Preview import without saving')
+    parser.add_argument('--phonenumbers', action='store_true',
+                       help='Format valid phone numbers as E.164 with the phonenumbers library (slower)')
     
     args = parser.parse_args()
     
@@ -385,26 +772,36 @@ def main():
         sys.exit(1)
     
     try:
-        importer = ContactImporter(args.output_dir)
-        contacts = importer.import_file(input_file, args.format)
-        
-        if not contacts:
-            print("No contacts found in file")
-            sys.exit(1)
+        importer = ContactImporter(args.output_dir, use_phonenumbers=args.phonenumbers)
         
         if args.dry_run:
+            contacts = importer.import_file(input_file, args.format)
+            
+            if not contacts:
+                print("No contacts found in file")
+                sys.exit(1)
+            
             print("\nDRY RUN - Preview of imported contacts:")
             for i, contact in enumerate(contacts[:5], 1):
                 print(f"{i}. {contact['name']} - {len(contact['phones'])} phones, {len(contact['emails'])} emails")
             if len(contacts) > 5:
                 print(f"... and {len(contacts) - 5} more contacts")
         else:
+            contacts = importer.iter_file(input_file, args.format)
+            
+            # Peek at the first contact so an empty input never creates an export file
+            first_contact = next(contacts, None)
+            if first_contact is None:
+                print("No contacts found in file")
+                sys.exit(1)
+            
             output_file = Path(args.output_dir) / f"imported_contacts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            importer.export_kinect_json(contacts, output_file)
+            # Stream contacts straight into the export so large files never sit in memory
+            total = importer.export_kinect_json(chain([first_contact], contacts), output_file)
             
             print(f"\n✅ Import successful!")
             print(f"📁 File saved to: {output_file}")
-            print(f"📊 Total contacts: {len(contacts)}")
+            print(f"📊 Total contacts: {total}")
             print(f"\nNext steps:")
             print(f"1. Go to http://localhost:3000/settings/import")
             print(f"2. Select the generated JSON file")